@@ -4,15 +4,20 @@ from flask import (
 )
 import os
 import re
+import sys
 import json
 import io
-import requests
-import pandas as pd
+import hashlib
+import importlib
+import subprocess
+import threading
+import click
 from datetime import datetime
 from dotenv import load_dotenv
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
-from docx import Document
+from markupsafe import Markup
+from modules import metrics, render_cache
 
 # optional collaboration module (your existing). Provide safe fallback if missing.
 try:
@@ -28,20 +33,43 @@ load_dotenv()
 
 app = Flask(__name__)
 app.secret_key = os.urandom(24)
+metrics.init_app(app)
+render_cache.init_app(app)
 
 # Folders & files
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
-UPLOAD_FOLDER = os.path.join(BASE_DIR, "uploads")
-DATA_FOLDER = os.path.join(BASE_DIR, "data")
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-os.makedirs(DATA_FOLDER, exist_ok=True)
+UPLOAD_FOLDER = os.getenv("PROJAI_UPLOAD_DIR", os.path.join(BASE_DIR, "uploads"))
+DATA_FOLDER = os.getenv("PROJAI_DATA_DIR", os.path.join(BASE_DIR, "data"))
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 
 IDEAS_FILE = os.path.join(DATA_FOLDER, "ideas.json")
 USERS_FILE = os.path.join(DATA_FOLDER, "users.json")
 CSV_FILE = os.path.join(DATA_FOLDER, "skills_companies_packages.csv")
+SKILLS_SNAPSHOT_FILE = os.getenv("SKILLS_SNAPSHOT", os.path.join(DATA_FOLDER, "skills_catalog.json"))
+APPLICATIONS_FILE = os.path.join(DATA_FOLDER, "applications.json")
 
 ALLOWED_EXTENSIONS = {"pdf", "docx"}
+DOCX_MIMETYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Helper: import heavy dependencies (pandas, docx, requests) on first use only
+def _lazy(module_name):
+    # always go through import_module: it waits for a concurrent import to finish
+    if module_name in sys.modules:
+        return importlib.import_module(module_name)
+    with metrics.stage(f"import:{module_name}"):
+        return importlib.import_module(module_name)
+
+# Helper: write JSON to a temp file and os.replace() it into place, so a
+# concurrent reader sees either the old or the new file, never a truncated one
+def _write_json(path, data, indent=4):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 # Helper: safe filename for downloads
 def _safe_filename(name: str) -> str:
@@ -53,6 +81,7 @@ def _safe_filename(name: str) -> str:
 # -------------------------
 UPLOAD_HISTORY_FILE = os.path.join(DATA_FOLDER, "uploads_history.json")
 
+@metrics.timed_io(UPLOAD_HISTORY_FILE, "r")
 def load_uploads():
     try:
         with open(UPLOAD_HISTORY_FILE, "r", encoding="utf-8") as f:
@@ -62,14 +91,32 @@ def load_uploads():
     except json.JSONDecodeError:
         return {}
 
+@metrics.timed_io(UPLOAD_HISTORY_FILE, "w")
 def save_uploads(data):
-    with open(UPLOAD_HISTORY_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    _write_json(UPLOAD_HISTORY_FILE, data)
+
+_uploads_lock = threading.Lock()
+
+def add_upload(user, saved_files):
+    # lock: concurrent read-modify-writes would drop each other's entries
+    with _uploads_lock:
+        uploads = load_uploads()  # load old JSON
+        # dictionary format
+        new_proj = {
+            "id": len(uploads) + 1,
+            "user": user,
+            "files": saved_files,
+            "created_at": datetime.utcnow().isoformat() + "Z"
+        }
+        uploads.append(new_proj)
+        save_uploads(uploads)
+    return new_proj
 
 # -------------------------
 # Ideas persistence helpers
 # ensures list structure, assigns incremental ids
 # -------------------------
+@metrics.timed_io(IDEAS_FILE, "r")
 def load_ideas():
     try:
         with open(IDEAS_FILE, "r", encoding="utf-8") as f:
@@ -85,12 +132,12 @@ def load_ideas():
     except json.JSONDecodeError:
         return []
 
+@metrics.timed_io(IDEAS_FILE, "w")
 def save_ideas(ideas):
     # ensure it's a list
     if not isinstance(ideas, list):
         raise ValueError("ideas must be a list")
-    with open(IDEAS_FILE, "w", encoding="utf-8") as f:
-        json.dump(ideas, f, indent=4, ensure_ascii=False)
+    _write_json(IDEAS_FILE, ideas)
 
 def next_idea_id(ideas):
     # return next numeric id
@@ -102,9 +149,46 @@ def next_idea_id(ideas):
     except Exception:
         return len(ideas) + 1
 
+# every read-modify-write of ideas.json goes through one of these, under the lock
+_ideas_lock = threading.Lock()
+
+def add_idea(user, idea_text, recommendations, sector="", language="English"):
+    with _ideas_lock:
+        ideas = load_ideas()
+        new_id = next_idea_id(ideas)
+        new_item = {
+            "id": new_id,
+            "user": user,
+            "idea": idea_text,
+            "sector": sector,
+            "language": language,
+            "recommendations": recommendations,
+            "created_at": datetime.utcnow().isoformat() + "Z"
+        }
+        ideas.append(new_item)
+        save_ideas(ideas)
+    return new_id
+
+def update_idea(idea_id, sector, language):
+    with _ideas_lock:
+        ideas = load_ideas()
+        for idea in ideas:
+            if str(idea.get("id")) == str(idea_id):
+                idea["sector"] = sector
+                idea["language"] = language
+                idea["updated_at"] = datetime.utcnow().isoformat() + "Z"
+                save_ideas(ideas)
+                return True
+    return False
+
+def clear_ideas():
+    with _ideas_lock:
+        save_ideas([])
+
 # -------------------------
 # Users persistence helpers
 # -------------------------
+@metrics.timed_io(USERS_FILE, "r")
 def load_users():
     try:
         with open(USERS_FILE, "r", encoding="utf-8") as f:
@@ -115,34 +199,116 @@ def load_users():
     except json.JSONDecodeError:
         return {}
 
+@metrics.timed_io(USERS_FILE, "w")
 def save_users(users):
-    with open(USERS_FILE, "w", encoding="utf-8") as f:
-        json.dump(users, f, indent=4, ensure_ascii=False)
+    _write_json(USERS_FILE, users)
 
 # -------------------------
-# Skills / companies load (CSV optional)
+# Applications persistence helpers
 # -------------------------
-skills_data = {}
-if os.path.exists(CSV_FILE):
+@metrics.timed_io(APPLICATIONS_FILE, "r")
+def load_applications():
     try:
-        df = pd.read_csv(CSV_FILE)
-        for _, row in df.iterrows():
-            if not {"skill", "company", "package"}.issubset(row.index):
-                continue
-            skill = str(row["skill"]).strip().lower()
-            company = str(row["company"]).strip()
-            package = str(row["package"]).strip()
-            skills_data.setdefault(skill, []).append({"name": company, "package": package})
+        with open(APPLICATIONS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
     except Exception:
-        skills_data = {}
-
-# fallback sample if CSV not present
-if not skills_data:
-    skills_data = {
-        "python": [{"name": "Acme", "package": "5 LPA"}],
-        "data science": [{"name": "DataCorp", "package": "6 LPA"}],
-        "java": [{"name": "BigSoft", "package": "4 LPA"}]
-    }
+        return []
+
+@metrics.timed_io(APPLICATIONS_FILE, "w")
+def save_applications(applications):
+    _write_json(APPLICATIONS_FILE, applications)
+
+_applications_lock = threading.Lock()
+
+def add_applications(entries):
+    with _applications_lock:
+        applications = load_applications()
+        applications.extend(entries)
+        save_applications(applications)
+
+# -------------------------
+# Skills / companies catalog (CSV optional)
+# loaded lazily on first use, from the prebuilt snapshot when it is fresh;
+# reloaded when the CSV or snapshot file changes on disk
+# -------------------------
+FALLBACK_SKILLS = {
+    "python": [{"name": "Acme", "package": "5 LPA"}],
+    "data science": [{"name": "DataCorp", "package": "6 LPA"}],
+    "java": [{"name": "BigSoft", "package": "4 LPA"}]
+}
+
+_skills = None  # (catalog, version, source mtimes) swapped as one unit
+_skills_lock = threading.Lock()
+
+def build_skills_catalog():
+    catalog = {}
+    if os.path.exists(CSV_FILE):
+        try:
+            pd = _lazy("pandas")
+            df = pd.read_csv(CSV_FILE)
+            metrics.track_io(CSV_FILE, "r")
+            for _, row in df.iterrows():
+                if not {"skill", "company", "package"}.issubset(row.index):
+                    continue
+                skill = str(row["skill"]).strip().lower()
+                company = str(row["company"]).strip()
+                package = str(row["package"]).strip()
+                catalog.setdefault(skill, []).append({"name": company, "package": package})
+        except Exception:
+            catalog = {}
+    return catalog
+
+@metrics.timed_io(SKILLS_SNAPSHOT_FILE, "r")
+def load_skills_snapshot():
+    try:
+        # stale snapshot (CSV edited since) is ignored
+        if os.path.exists(CSV_FILE) and os.path.getmtime(SKILLS_SNAPSHOT_FILE) < os.path.getmtime(CSV_FILE):
+            return {}
+        with open(SKILLS_SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+@metrics.timed_io(SKILLS_SNAPSHOT_FILE, "w")
+def save_skills_snapshot(catalog):
+    _write_json(SKILLS_SNAPSHOT_FILE, catalog, indent=None)
+
+def _skills_sources_mtime():
+    mtimes = []
+    for path in (CSV_FILE, SKILLS_SNAPSHOT_FILE):
+        try:
+            mtimes.append(os.path.getmtime(path))
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+def _skills_catalog():
+    global _skills
+    sources = _skills_sources_mtime()
+    current = _skills
+    if current is None or current[2] != sources:
+        with _skills_lock:
+            current = _skills
+            if current is None or current[2] != sources:
+                with metrics.stage("load_skills"):
+                    catalog = load_skills_snapshot() or build_skills_catalog() or dict(FALLBACK_SKILLS)
+                    version = hashlib.sha1(json.dumps(catalog, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+                    current = _skills = (catalog, version, sources)
+    return current
+
+def get_skills_data():
+    return _skills_catalog()[0]
+
+@app.template_global()
+def catalog_fragment(template_name, **params):
+    """Render a catalog-derived partial once per (params, catalog version), e.g. skill=..."""
+    catalog, version, _ = _skills_catalog()
+    return render_cache.fragment(
+        (template_name, tuple(sorted(params.items()))),
+        version,
+        lambda: Markup(render_template(template_name, skills_data=catalog, **params))
+    )
 
 # -------------------------
 # Utilities
@@ -196,35 +362,6 @@ def register():
         return redirect(url_for("login"))
     return render_template("register.html")
 
-from flask import send_file
-from docx import Document
-import io
-
-@app.route('/start_project/<int:idea_id>')
-def start_projects(idea_id):
-    ideas = load_ideas()  # load ideas.json
-    if 0 <= idea_id < len(ideas):
-        idea = ideas[idea_id]
-        
-        # Create Word document in memory
-        doc = Document()
-        doc.add_heading(idea["idea"], level=1)
-        doc.add_paragraph(f"Sector: {idea.get('sector', 'N/A')}")
-        doc.add_paragraph(f"Language: {idea.get('language', 'N/A')}")
-        doc.add_heading("AI Recommendations:", level=2)
-        doc.add_paragraph(idea.get("recommendations", "No recommendations found."))
-
-        # Save document to memory buffer
-        buffer = io.BytesIO()
-        doc.save(buffer)
-        buffer.seek(0)
-
-        # Send file as download
-        filename = f"{idea['idea'].replace(' ', '_')}.docx"
-        return send_file(buffer, as_attachment=True, download_name=filename, mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document")
-
-    return "Invalid Idea ID", 404
-
 @app.route("/forget_password", methods=["GET", "POST"])
 def forget_password():
     if request.method == "POST":
@@ -274,17 +411,16 @@ def skills():
         raw_skill = request.form.get("skill", "").strip().lower()
         if not raw_skill:
             flash("Please enter a valid skill.", "danger")
-            return render_template("skills.html", skills_data=skills_data)
+            return render_template("skills.html")
         session["skill"] = raw_skill
-        companies = skills_data.get(raw_skill, [])
+        companies = get_skills_data().get(raw_skill, [])
         if not companies:
             flash(f"No jobs available for '{raw_skill}'", "warning")
         return render_template("jobs.html",
                                skill=raw_skill,
                                encoded_skill=encode_skill(raw_skill),
-                               companies=companies,
-                               skills_data=skills_data)
-    return render_template("skills.html", skills_data=skills_data)
+                               companies=companies)
+    return render_template("skills.html")
 
 @app.route("/upload_project", methods=["GET", "POST"])
 def upload_project():
@@ -296,27 +432,16 @@ def upload_project():
         if not files:
             return "No files uploaded!", 400
 
-        uploads = load_uploads()  # load old JSON
-        new_id = len(uploads) + 1
         saved_files = []
 
-        for file in files:
-            filename = secure_filename(file.filename)
-            filepath = os.path.join(UPLOAD_FOLDER, filename)
-            file.save(filepath)
-            saved_files.append(filename)
-
-        # dictionary format
-        new_proj = {
-            "id": new_id,
-            "user": session["username"],
-            "files": saved_files,
-            "created_at": datetime.utcnow().isoformat() + "Z"
-        }
-
-        uploads.append(new_proj)
-        save_uploads(uploads) 
+        with metrics.stage("save_files"):
+            for file in files:
+                filename = secure_filename(file.filename)
+                filepath = os.path.join(UPLOAD_FOLDER, filename)
+                file.save(filepath)
+                saved_files.append(filename)
 
+        add_upload(session["username"], saved_files)
         return redirect(url_for("project_history"))
 
     return render_template("upload_project.html")
@@ -353,7 +478,7 @@ def apply_company():
         # if coming from company selection (button submit with hidden 'company')
         if "submit" not in request.form and request.form.get("company"):
             company = request.form.get("company")
-            return render_template("apply_form.html", company=company, skills_data=skills_data)
+            return render_template("apply_form.html", company=company)
 
         # full form submission
         first_name = request.form.get("first_name", "")
@@ -373,14 +498,7 @@ def apply_company():
             resume_filename = secure_filename(resume.filename)
             resume.save(os.path.join(app.config["UPLOAD_FOLDER"], resume_filename))
 
-        apps_path = os.path.join(DATA_FOLDER, "applications.json")
-        try:
-            with open(apps_path, "r", encoding="utf-8") as f:
-                applications = json.load(f)
-        except Exception:
-            applications = []
-
-        applications.append({
+        add_applications([{
             "name": name,
             "email": email,
             "phone": full_phone,
@@ -388,15 +506,12 @@ def apply_company():
             "experience": experience,
             "company": company,
             "resume": resume_filename
-        })
-
-        with open(apps_path, "w", encoding="utf-8") as f:
-            json.dump(applications, f, indent=4, ensure_ascii=False)
+        }])
 
         session["user_details"] = {"name": name, "email": email, "phone": full_phone}
-        return render_template("thankyou.html", name=name, company=company, skills_data=skills_data)
+        return render_template("thankyou.html", name=name, company=company)
 
-    return render_template("apply_form.html", skills_data=skills_data)
+    return render_template("apply_form.html")
 
 @app.route("/apply_all", methods=["POST"])
 def apply_all_or_select():
@@ -413,7 +528,7 @@ def select_apply(encoded_skill):
     if "username" not in session:
         return redirect(url_for("login"))
     skill = decode_skill(encoded_skill)
-    companies = skills_data.get(skill, [])
+    companies = get_skills_data().get(skill, [])
     preselect_all = request.args.get("all") == "1"
     user_details = session.get("user_details", {"name": "", "email": "", "phone": ""})
     if not companies:
@@ -424,8 +539,7 @@ def select_apply(encoded_skill):
                            encoded_skill=encoded_skill,
                            companies=companies,
                            preselect_all=preselect_all,
-                           user_details=user_details,
-                           skills_data=skills_data)
+                           user_details=user_details)
 
 @app.route("/apply_selected", methods=["POST"])
 def apply_selected_route():
@@ -443,15 +557,8 @@ def apply_selected_route():
     resume_filename = secure_filename(resume.filename)
     resume.save(os.path.join(app.config["UPLOAD_FOLDER"], resume_filename))
 
-    apps_path = os.path.join(DATA_FOLDER, "applications.json")
-    try:
-        with open(apps_path, "r", encoding="utf-8") as f:
-            apps = json.load(f)
-    except Exception:
-        apps = []
-
-    for comp in selected_companies:
-        apps.append({
+    add_applications([
+        {
             "name": session.get("user_details", {}).get("name", ""),
             "email": session.get("user_details", {}).get("email", ""),
             "phone": session.get("user_details", {}).get("phone", ""),
@@ -459,14 +566,13 @@ def apply_selected_route():
             "experience": "",
             "company": comp,
             "resume": resume_filename
-        })
-    with open(apps_path, "w", encoding="utf-8") as f:
-        json.dump(apps, f, indent=4, ensure_ascii=False)
+        }
+        for comp in selected_companies
+    ])
 
     return render_template("thankyou.html",
                            name=session.get("user_details", {}).get("name", "User"),
-                           company=", ".join(selected_companies),
-                           skills_data=skills_data)
+                           company=", ".join(selected_companies))
 
 # -------------------------
 # Resume check endpoint (used by skills.html)
@@ -488,6 +594,34 @@ def check_resume():
 # AI Recommendations (Gemini - optional)
 # -------------------------
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", None)
+GEMINI_API_URL = os.getenv(
+    "GEMINI_API_URL",
+    "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent"
+)
+
+def placeholder_recommendations(idea_text):
+    return f"AI key not configured. Example recommendations for: {idea_text}\n\n1) Define scope.\n2) Choose tech stack.\n3) Build MVP."
+
+def gemini_request(idea_text):
+    # (url, headers, payload) shared by the sync route and the ASGI handler
+    payload = {
+        "contents": [{
+            "parts": [{"text": f"User idea: {idea_text}\nGenerate structured recommendations, improvements, and next steps."}]
+        }]
+    }
+    headers = {"Content-Type": "application/json"}
+    return f"{GEMINI_API_URL}?key={GEMINI_API_KEY}", headers, payload
+
+def parse_gemini_result(result):
+    candidates = result.get("candidates") or []
+    recommendations = ""
+    if candidates:
+        parts = candidates[0].get("content", {}).get("parts", [])
+        if parts:
+            recommendations = parts[0].get("text", "")
+    if not recommendations:
+        recommendations = json.dumps(result, indent=2)[:2000]
+    return recommendations
 
 @app.route("/recommend", methods=["POST"])
 def recommend():
@@ -500,48 +634,20 @@ def recommend():
 
     # ---- 1. generate recommendations ----
     if not GEMINI_API_KEY:
-        recommendations = f"AI key not configured. Example recommendations for: {idea_text}\n\n1) Define scope.\n2) Choose tech stack.\n3) Build MVP."
+        recommendations = placeholder_recommendations(idea_text)
     else:
-        payload = {
-            "contents": [{
-                "parts": [{"text": f"User idea: {idea_text}\nGenerate structured recommendations, improvements, and next steps."}]
-            }]
-        }
-        headers = {"Content-Type": "application/json"}
+        url, headers, payload = gemini_request(idea_text)
         try:
-            resp = requests.post(
-                f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={GEMINI_API_KEY}",
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
+            requests = _lazy("requests")
+            with metrics.outbound("gemini"):
+                resp = requests.post(url, headers=headers, json=payload, timeout=30)
             resp.raise_for_status()
-            result = resp.json()
-            candidates = result.get("candidates") or []
-            recommendations = ""
-            if candidates:
-                parts = candidates[0].get("content", {}).get("parts", [])
-                if parts:
-                    recommendations = parts[0].get("text", "")
-            if not recommendations:
-                recommendations = json.dumps(result, indent=2)[:2000]
+            recommendations = parse_gemini_result(resp.json())
         except Exception as e:
             return jsonify({"recommendations": f"Error: {str(e)}"}), 502
 
     # ---- 2. save idea immediately ----
-    ideas = load_ideas()
-    new_id = next_idea_id(ideas)
-    new_item = {
-        "id": new_id,
-        "user": session["username"],
-        "idea": idea_text,
-        "sector": "",
-        "language": "English",
-        "recommendations": recommendations,
-        "created_at": datetime.utcnow().isoformat() + "Z"
-    }
-    ideas.append(new_item)
-    save_ideas(ideas)
+    new_id = add_idea(session["username"], idea_text, recommendations)
 
     # ---- 3. return response ----
     return jsonify({"recommendations": recommendations, "idea_id": new_id})
@@ -553,7 +659,7 @@ def recommend():
 def ideas():
     if "username" not in session:
         return redirect(url_for("login"))
-    return render_template("recommend.html", skills_data=skills_data)
+    return render_template("recommend.html")
 
 # collaboration_form (GET) - show collaboration form, accepts idea + recommendations via query params
 @app.route("/collaboration_form", methods=["GET"])
@@ -576,7 +682,7 @@ def clear_history():
         return redirect(url_for("login"))
     
     # Empty list → overwrite ideas.json
-    save_ideas([])
+    clear_ideas()
     return redirect(url_for("welcome"))
     
 # collaboration (POST) - save to ideas.json with id and recommendations
@@ -590,37 +696,47 @@ def collaboration():
     sector = data.get("sector", "")
     language = data.get("language", "English")
 
-    ideas = load_ideas()
-
     # ✅ if idea_id exists → update the existing idea instead of adding duplicate
     if idea_id:
-        for idea in ideas:
-            if str(idea.get("id")) == str(idea_id):
-                idea["sector"] = sector
-                idea["language"] = language
-                idea["updated_at"] = datetime.utcnow().isoformat() + "Z"
-                break
+        update_idea(idea_id, sector, language)
     else:
         # (backup: only if somehow no idea_id came)
-        new_id = next_idea_id(ideas)
-        new_item = {
-            "id": new_id,
-            "user": session["username"],
-            "idea": data.get("idea", ""),
-            "sector": sector,
-            "language": language,
-            "recommendations": data.get("recommendations", ""),
-            "created_at": datetime.utcnow().isoformat() + "Z"
-        }
-        ideas.append(new_item)
-
-    save_ideas(ideas)
+        add_idea(session["username"], data.get("idea", ""), data.get("recommendations", ""),
+                 sector=sector, language=language)
     return redirect(url_for("welcome"))
 
 # -------------------------
 # Start project: downloads a .docx containing the idea + recommendations
 # Template & welcome expect to call this with idea_id
 # -------------------------
+def build_project_docx(idea):
+    with metrics.stage("build_docx"):
+        buf = io.BytesIO()
+        doc = _lazy("docx").Document()
+        doc.add_heading(f"Project: {idea.get('idea', '')}", level=0)
+        doc.add_paragraph(f"Submitted by: {idea.get('user', '')}")
+        doc.add_paragraph(f"Sector: {idea.get('sector', '')}")
+        doc.add_paragraph(f"Preferred Language: {idea.get('language', '')}")
+        if idea.get("created_at"):
+            doc.add_paragraph(f"Created At: {idea.get('created_at')}")
+        doc.add_heading("AI Recommendations", level=1)
+        recs = idea.get("recommendations", "")
+        if recs:
+            for line in recs.splitlines():
+                doc.add_paragraph(line)
+        else:
+            doc.add_paragraph("No recommendations saved for this idea.")
+
+        doc.add_heading("Next Steps (Suggested)", level=1)
+        doc.add_paragraph("1) Create a repo/folder locally (e.g., in VSCode).")
+        doc.add_paragraph("2) Copy these recommendations into README.md or project plan.")
+        doc.add_paragraph("3) Start implementing modules one-by-one and commit often.")
+        doc.add_paragraph("4) Iterate with the AI to refine next steps as you progress.")
+
+        doc.save(buf)
+        buf.seek(0)
+    return buf
+
 @app.route("/start_project/<int:idea_id>")
 def start_project(idea_id):
     ideas = load_ideas()
@@ -630,37 +746,14 @@ def start_project(idea_id):
         flash("Idea not found.", "danger")
         return redirect(url_for("welcome"))
 
-    buf = io.BytesIO()
-    doc = Document()
-    doc.add_heading(f"Project: {idea.get('idea', '')}", level=0)
-    doc.add_paragraph(f"Submitted by: {idea.get('user', '')}")
-    doc.add_paragraph(f"Sector: {idea.get('sector', '')}")
-    doc.add_paragraph(f"Preferred Language: {idea.get('language', '')}")
-    if idea.get("created_at"):
-        doc.add_paragraph(f"Created At: {idea.get('created_at')}")
-    doc.add_heading("AI Recommendations", level=1)
-    recs = idea.get("recommendations", "")
-    if recs:
-        for line in recs.splitlines():
-            doc.add_paragraph(line)
-    else:
-        doc.add_paragraph("No recommendations saved for this idea.")
-
-    doc.add_heading("Next Steps (Suggested)", level=1)
-    doc.add_paragraph("1) Create a repo/folder locally (e.g., in VSCode).")
-    doc.add_paragraph("2) Copy these recommendations into README.md or project plan.")
-    doc.add_paragraph("3) Start implementing modules one-by-one and commit often.")
-    doc.add_paragraph("4) Iterate with the AI to refine next steps as you progress.")
-
-    doc.save(buf)
-    buf.seek(0)
+    buf = build_project_docx(idea)
 
     filename = _safe_filename(idea.get("idea", "project")) + ".docx"
     return send_file(
         buf,
         as_attachment=True,
         download_name=filename,
-        mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        mimetype=DOCX_MIMETYPE
     )
 
 # -------------------------
@@ -677,10 +770,70 @@ def feed():
     return render_template("feed.html", feed=feed_data)
 
 # -------------------------
-# Start the app
+# Application factory
+# importing this module has no file system side effects and skips
+# pandas/docx/requests; create_app() does the one-time setup
+# (gunicorn "app:create_app()")
+# there is one module-level app: paths and options come from environment
+# variables (PROJAI_DATA_DIR, PROJAI_UPLOAD_DIR, PRELOAD_SKILLS, ...), read
+# at import, so every route and asgi.py see the same values
 # -------------------------
-if __name__ == "__main__":
+PRELOAD_SKILLS = os.getenv("PRELOAD_SKILLS", "").lower() in ("1", "true", "yes")
+PRELOAD_TEMPLATES = os.getenv("PRELOAD_TEMPLATES", "").lower() in ("1", "true", "yes")
+
+def create_app():
+    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+    os.makedirs(DATA_FOLDER, exist_ok=True)
     # create empty ideas file if missing (safe initialization)
     if not os.path.exists(IDEAS_FILE):
         save_ideas([])
-    app.run(debug=True)
+    if os.getenv("TEMPLATE_CACHE_DIR"):
+        # compiled templates persist across restarts/workers
+        os.makedirs(os.environ["TEMPLATE_CACHE_DIR"], exist_ok=True)
+        app.jinja_env.bytecode_cache = _lazy("jinja2").FileSystemBytecodeCache(os.environ["TEMPLATE_CACHE_DIR"])
+    if PRELOAD_SKILLS:
+        get_skills_data()
+    if PRELOAD_TEMPLATES:
+        for name in app.jinja_env.list_templates(extensions=["html"]):
+            app.jinja_env.get_template(name)
+    return app
+
+@app.cli.command("build-skills-snapshot")
+def build_skills_snapshot_command():
+    """Parse the skills CSV once and write the JSON snapshot used at startup."""
+    catalog = build_skills_catalog()
+    if not catalog:
+        raise click.ClickException(f"No skills found in {CSV_FILE}")
+    save_skills_snapshot(catalog)
+    click.echo(f"Wrote {len(catalog)} skills to {SKILLS_SNAPSHOT_FILE}")
+
+@app.cli.command("import-profile")
+@click.option("--top", default=15, help="Number of slowest imports to show.")
+def import_profile_command(top):
+    """Show the slowest imports triggered by `import app` (python -X importtime)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=BASE_DIR, capture_output=True, text=True
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        try:
+            rows.append((int(cumulative_us), int(self_us), name))
+        except ValueError:
+            continue  # header line
+    if proc.returncode != 0 or not rows:
+        raise click.ClickException(proc.stderr.strip() or "import failed")
+    total = next((r[0] for r in rows if r[2] == "app"), max(r[0] for r in rows))
+    click.echo(f"import app: {total / 1000:.1f} ms")
+    click.echo(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        click.echo(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+
+# -------------------------
+# Start the app
+# -------------------------
+if __name__ == "__main__":
+    create_app().run(debug=True)
@@ -0,0 +1,200 @@
+"""ASGI entry point: async handlers for the I/O-bound routes, Flask for the rest.
+
+    uvicorn asgi:app --port 5000
+
+/recommend, POST /upload_project, /check_resume and /start_project/<id> are
+served natively so waiting on Gemini, streaming files or sending buffers does
+not hold a worker thread. Every other route (pages, auth, /metrics) is passed
+through to the Flask app, which shares the same session cookie.
+"""
+import os
+import contextlib
+
+import anyio
+import httpx
+from a2wsgi import WSGIMiddleware
+from itsdangerous import BadSignature
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse, RedirectResponse, Response
+from starlette.routing import Mount, Route
+from werkzeug.utils import secure_filename
+
+import app as projai
+from modules import metrics
+
+flask_app = projai.create_app()
+
+GEMINI_MAX_CONNECTIONS = int(os.getenv("GEMINI_MAX_CONNECTIONS", "200"))
+WSGI_THREADS = int(os.getenv("WSGI_THREADS", "10"))
+CHUNK_SIZE = 64 * 1024
+
+http_client = None
+
+
+# -------------------------
+# Flask session bridge (same signed cookie as the Flask routes)
+# -------------------------
+def _serializer():
+    return flask_app.session_interface.get_signing_serializer(flask_app)
+
+
+def load_session(request):
+    cookie = request.cookies.get(flask_app.config["SESSION_COOKIE_NAME"])
+    if not cookie:
+        return {}
+    max_age = int(flask_app.permanent_session_lifetime.total_seconds())
+    try:
+        return _serializer().loads(cookie, max_age=max_age)
+    except BadSignature:
+        return {}
+
+
+def flash_redirect(session, message, category, location):
+    # same storage format as flask.flash(), so the next Flask page shows it
+    session = dict(session)
+    session["_flashes"] = list(session.get("_flashes", [])) + [(category, message)]
+    response = RedirectResponse(location, status_code=302)
+    response.set_cookie(
+        flask_app.config["SESSION_COOKIE_NAME"],
+        _serializer().dumps(session),
+        path=flask_app.config["SESSION_COOKIE_PATH"] or "/",
+        httponly=flask_app.config["SESSION_COOKIE_HTTPONLY"],
+        samesite=flask_app.config["SESSION_COOKIE_SAMESITE"] or "lax",
+    )
+    return response
+
+
+# -------------------------
+# Helpers
+# -------------------------
+def instrumented(route):
+    """Record the handler like the Flask routes: /metrics series, stages and slow-request log."""
+    def decorator(handler):
+        async def wrapper(request):
+            token = metrics.begin_request()
+            response = await handler(request)
+            metrics.finish_request(
+                token, request.method, request.url.path, route, response.status_code,
+                int(request.headers.get("content-length") or 0),
+                len(response.body) if hasattr(response, "body") else None
+            )
+            return response
+        return wrapper
+    return decorator
+
+
+async def stream_to_disk(upload, path):
+    with metrics.stage("save_files"):
+        async with await anyio.open_file(path, "wb") as out:
+            while chunk := await upload.read(CHUNK_SIZE):
+                await out.write(chunk)
+
+
+# -------------------------
+# Async handlers
+# -------------------------
+@instrumented("recommend")
+async def recommend(request):
+    session = load_session(request)
+    if "username" not in session:
+        return JSONResponse({"error": "login required"}, status_code=401)
+    try:
+        data = await request.json()
+    except ValueError:
+        data = await request.form()
+    idea_text = ((data or {}).get("idea") or "").strip()
+    if not idea_text:
+        return JSONResponse({"recommendations": "Please provide an idea."}, status_code=400)
+
+    # ---- 1. generate recommendations ----
+    if not projai.GEMINI_API_KEY:
+        recommendations = projai.placeholder_recommendations(idea_text)
+    else:
+        url, headers, payload = projai.gemini_request(idea_text)
+        try:
+            with metrics.outbound("gemini"):
+                resp = await http_client.post(url, headers=headers, json=payload)
+            resp.raise_for_status()
+            recommendations = projai.parse_gemini_result(resp.json())
+        except Exception as e:
+            return JSONResponse({"recommendations": f"Error: {str(e)}"}, status_code=502)
+
+    # ---- 2. save idea (file I/O off the event loop) ----
+    new_id = await anyio.to_thread.run_sync(projai.add_idea, session["username"], idea_text, recommendations)
+    return JSONResponse({"recommendations": recommendations, "idea_id": new_id})
+
+
+@instrumented("upload_project")
+async def upload_project(request):
+    session = load_session(request)
+    if "username" not in session:
+        return RedirectResponse("/login", status_code=302)
+
+    async with request.form() as form:
+        files = [f for f in form.getlist("project_files") if getattr(f, "filename", None)]
+        if not files:
+            return PlainTextResponse("No files uploaded!", status_code=400)
+        saved_files = []
+        for upload in files:
+            filename = secure_filename(upload.filename)
+            await stream_to_disk(upload, os.path.join(projai.UPLOAD_FOLDER, filename))
+            saved_files.append(filename)
+
+    await anyio.to_thread.run_sync(projai.add_upload, session["username"], saved_files)
+    return RedirectResponse("/project_history", status_code=302)
+
+
+@instrumented("check_resume")
+async def check_resume(request):
+    async with request.form() as form:
+        upload = form.get("resume")
+        if upload is None or isinstance(upload, str):
+            return JSONResponse({"error": "No resume uploaded"}, status_code=400)
+        filename = secure_filename(upload.filename or "")
+        if filename == "":
+            return JSONResponse({"error": "No selected file"}, status_code=400)
+        await stream_to_disk(upload, os.path.join(projai.UPLOAD_FOLDER, filename))
+    return JSONResponse({"message": "Resume uploaded successfully!", "filename": filename})
+
+
+@instrumented("start_project")
+async def start_project(request):
+    idea_id = request.path_params["idea_id"]
+    ideas = await anyio.to_thread.run_sync(projai.load_ideas)
+    idea = next((i for i in ideas if int(i.get("id", 0)) == idea_id), None)
+    if not idea:
+        return flash_redirect(load_session(request), "Idea not found.", "danger", "/")
+
+    # python-docx is CPU bound: build in a worker thread
+    buf = await anyio.to_thread.run_sync(projai.build_project_docx, idea)
+    filename = projai._safe_filename(idea.get("idea", "project")) + ".docx"
+    return Response(
+        buf.getvalue(),
+        media_type=projai.DOCX_MIMETYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+# -------------------------
+# App
+# -------------------------
+@contextlib.asynccontextmanager
+async def lifespan(_app):
+    global http_client
+    limits = httpx.Limits(max_connections=GEMINI_MAX_CONNECTIONS, max_keepalive_connections=GEMINI_MAX_CONNECTIONS)
+    async with httpx.AsyncClient(timeout=30, limits=limits) as client:
+        http_client = client
+        yield
+    http_client = None
+
+
+app = Starlette(
+    routes=[
+        Route("/recommend", recommend, methods=["POST"]),
+        Route("/upload_project", upload_project, methods=["POST"]),
+        Route("/check_resume", check_resume, methods=["POST"]),
+        Route("/start_project/{idea_id:int}", start_project),
+        Mount("/", app=WSGIMiddleware(flask_app, workers=WSGI_THREADS)),
+    ],
+    lifespan=lifespan,
+)
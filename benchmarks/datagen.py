@@ -0,0 +1,123 @@
+"""Synthetic data generator for the benchmark suite.
+
+Writes users.json, ideas.json, uploads_history.json, applications.json,
+feed.json and skills_companies_packages.csv into a data folder, in the
+same shapes app.py reads and writes.
+
+    python -m benchmarks.datagen --records 100000 --out /tmp/projai-data
+"""
+import os
+import csv
+import json
+import random
+import argparse
+from datetime import datetime, timedelta
+
+from werkzeug.security import generate_password_hash
+
+BENCH_PASSWORD = "bench-pass"
+
+SECTORS = ["Education", "Healthcare", "Finance", "Agriculture", "Retail", "Energy"]
+LANGUAGES = ["English", "Telugu", "Hindi", "Tamil"]
+BASE_SKILLS = ["python", "java", "data science", "c++", "javascript", "sql", "react", "devops"]
+
+
+def _username(i):
+    return f"user{i:07d}"
+
+
+def _timestamp(rng):
+    moment = datetime(2024, 1, 1) + timedelta(seconds=rng.randint(0, 60 * 60 * 24 * 365))
+    return moment.isoformat() + "Z"
+
+
+def _skill_names(records):
+    # catalog grows roughly with sqrt(records): 1k -> ~32 skills, 1M -> 1000
+    count = max(len(BASE_SKILLS), int(records ** 0.5))
+    return BASE_SKILLS + [f"skill {i}" for i in range(count - len(BASE_SKILLS))]
+
+
+def _write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+
+
+def generate(data_dir, records=1000, seed=42):
+    """Generate every data file with `records` entries each. Returns the skill names."""
+    rng = random.Random(seed)
+    os.makedirs(data_dir, exist_ok=True)
+
+    # one hash shared by all users; hashing 1M passwords would dominate generation
+    password = generate_password_hash(BENCH_PASSWORD)
+    _write_json(os.path.join(data_dir, "users.json"), {
+        _username(i): {"email": f"{_username(i)}@example.com", "password": password}
+        for i in range(records)
+    })
+
+    _write_json(os.path.join(data_dir, "ideas.json"), [
+        {
+            "id": i + 1,
+            "user": _username(rng.randrange(records)),
+            "idea": f"Synthetic idea {i + 1}",
+            "sector": rng.choice(SECTORS),
+            "language": rng.choice(LANGUAGES),
+            "recommendations": "1) Define scope.\n2) Choose tech stack.\n3) Build MVP.",
+            "created_at": _timestamp(rng)
+        }
+        for i in range(records)
+    ])
+
+    _write_json(os.path.join(data_dir, "uploads_history.json"), [
+        {
+            "id": i + 1,
+            "user": _username(rng.randrange(records)),
+            "files": [f"project_{i + 1}.pdf"],
+            "created_at": _timestamp(rng)
+        }
+        for i in range(records)
+    ])
+
+    skills = _skill_names(records)
+    _write_json(os.path.join(data_dir, "applications.json"), [
+        {
+            "name": f"Applicant {i}",
+            "email": f"applicant{i}@example.com",
+            "phone": "+910000000000",
+            "address": "",
+            "experience": str(rng.randint(0, 10)),
+            "company": f"Company {rng.randrange(records)}",
+            "resume": f"resume_{i}.pdf"
+        }
+        for i in range(records)
+    ])
+
+    with open(os.path.join(data_dir, "skills_companies_packages.csv"), "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["skill", "company", "role", "package", "location", "notes"])
+        for i in range(records):
+            writer.writerow([rng.choice(skills), f"Company {i}", "Engineer", f"{rng.randint(3, 30)} LPA", "India", ""])
+
+    # feed.json: {user: [posts]}, `records` posts spread over the users
+    feed = {}
+    for i in range(records):
+        feed.setdefault(_username(rng.randrange(records)), []).append({
+            "idea": f"Synthetic idea {i + 1}",
+            "sector": rng.choice(SECTORS),
+            "language": rng.choice(LANGUAGES),
+            "comments": [f"Comment {n}" for n in range(rng.randint(0, 3))]
+        })
+    _write_json(os.path.join(data_dir, "feed.json"), feed)
+    return skills
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic ProjAI data files.")
+    parser.add_argument("--records", type=int, default=1000, help="entries per data file (1k to 1M)")
+    parser.add_argument("--out", required=True, help="data folder to write into")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    generate(args.out, args.records, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+"""Load/benchmark harness for the Flask and ASGI apps.
+
+Generates synthetic data, points app.py at it (PROJAI_DATA_DIR /
+PROJAI_UPLOAD_DIR) and at a local stub LLM (GEMINI_API_URL), then drives
+the main routes concurrently and prints a JSON report with throughput,
+p50/p99 latency and memory per route. By default requests go through Flask
+test clients in this process; with --asgi they go over HTTP to
+`uvicorn asgi:app` started in a subprocess.
+
+    python -m benchmarks.run --records 10000 --requests 200 --concurrency 8
+    python -m benchmarks.run --asgi --routes recommend --requests 200 --concurrency 200 --llm-delay 1
+    python -m benchmarks.run --out report.json --baseline last.json --max-regression 0.25
+
+Phases run read-only routes first, so writes from upload_project/recommend
+do not skew the other numbers. The last phase ("mixed") then interleaves
+ideas.json writes (recommend, collaboration) with reads (start_project,
+welcome); a start_project that misses an existing idea counts as an error,
+as does any synthetic idea missing from ideas.json afterwards.
+"""
+import io
+import os
+import sys
+import json
+import math
+import queue
+import time
+import random
+import shutil
+import socket
+import argparse
+import platform
+import resource
+import tempfile
+import importlib
+import subprocess
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.datagen import generate, BENCH_PASSWORD, _username
+from benchmarks.stub_llm import start_stub
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_ROUTES = ["login", "welcome", "skills", "feed", "start_project", "upload_project", "recommend", "mixed"]
+
+
+# -------------------------
+# Route scenarios: (client, i, ctx) -> response
+# -------------------------
+def _login(client, i, ctx):
+    return client.post("/login", data={"username": ctx["user"], "password": BENCH_PASSWORD})
+
+def _welcome(client, i, ctx):
+    return client.get("/")
+
+def _skills(client, i, ctx):
+    if i % 2:
+        return client.get("/skills")
+    return client.post("/skills", data={"skill": ctx["rng"].choice(ctx["skills"])})
+
+def _feed(client, i, ctx):
+    return client.get("/feed")
+
+def _start_project(client, i, ctx):
+    # synthetic ideas have ids 1..records
+    return client.get(f"/start_project/{ctx['rng'].randrange(ctx['records']) + 1}")
+
+def _upload_project(client, i, ctx):
+    data = {"project_files": (io.BytesIO(b"x" * ctx["upload_bytes"]), f"bench_{i}.pdf")}
+    return client.post("/upload_project", data=data, content_type="multipart/form-data")
+
+def _recommend(client, i, ctx):
+    return client.post("/recommend", json={"idea": f"Benchmark idea {i}"})
+
+def _mixed(client, i, ctx):
+    kind = i % 4
+    if kind == 0:
+        return _recommend(client, i, ctx)
+    if kind == 1:
+        idea_id = ctx["rng"].randrange(ctx["records"]) + 1
+        return client.post("/collaboration", data={"idea_id": str(idea_id), "sector": "Education", "language": "English"})
+    if kind == 2:
+        resp = _start_project(client, i, ctx)
+        if resp.status_code != 200:
+            # redirect back to / means "Idea not found" for an id that exists
+            raise AssertionError(f"start_project returned {resp.status_code}")
+        return resp
+    return _welcome(client, i, ctx)
+
+SCENARIOS = {
+    "login": _login,
+    "welcome": _welcome,
+    "skills": _skills,
+    "feed": _feed,
+    "start_project": _start_project,
+    "upload_project": _upload_project,
+    "recommend": _recommend,
+    "mixed": _mixed,
+}
+
+
+# -------------------------
+# Helpers
+# -------------------------
+def _percentile(sorted_values, pct):
+    # nearest-rank
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _rss_mb(pid="self"):
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / (1024 * 1024)
+    except OSError:
+        return 0.0
+
+
+def _lost_ideas(data_dir, records):
+    """Synthetic ideas (ids 1..records) no longer in ideas.json."""
+    try:
+        with open(os.path.join(data_dir, "ideas.json"), "r", encoding="utf-8") as f:
+            ids = {idea.get("id") for idea in json.load(f)}
+    except (OSError, ValueError):
+        return records
+    return sum(1 for i in range(1, records + 1) if i not in ids)
+
+
+def _app_env(data_dir, upload_dir, llm_url):
+    os.environ["PROJAI_DATA_DIR"] = data_dir
+    os.environ["PROJAI_UPLOAD_DIR"] = upload_dir
+    os.environ["GEMINI_API_URL"] = llm_url
+    os.environ["GEMINI_API_KEY"] = "bench"
+    os.environ.setdefault("SLOW_REQUEST_MS", "inf")
+
+
+def _load_app(data_dir, upload_dir, llm_url):
+    _app_env(data_dir, upload_dir, llm_url)
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    return importlib.import_module("app").create_app()
+
+
+# -------------------------
+# --asgi: uvicorn subprocess + HTTP clients
+# -------------------------
+class _HttpResponse:
+    def __init__(self, response):
+        self.status_code = response.status_code
+        self._body = response.content
+
+    def get_data(self):
+        return self._body
+
+
+class HttpClient:
+    """The subset of the Flask test client API the scenarios use, over real HTTP."""
+
+    def __init__(self, base_url):
+        import httpx
+        self._client = httpx.Client(base_url=base_url, timeout=120)
+
+    def get(self, path):
+        return _HttpResponse(self._client.get(path))
+
+    def post(self, path, data=None, json=None, content_type=None):
+        files = None
+        if content_type == "multipart/form-data":
+            # test client style: {"field": (fileobj, filename)}
+            files = {k: (v[1], v[0]) for k, v in data.items() if isinstance(v, tuple)}
+            data = {k: v for k, v in data.items() if not isinstance(v, tuple)}
+        return _HttpResponse(self._client.post(path, data=data, json=json, files=files))
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_asgi_server(data_dir, upload_dir, llm_url, timeout=60):
+    """Start `uvicorn asgi:app` on a free port; returns (process, base_url)."""
+    import httpx
+    _app_env(data_dir, upload_dir, llm_url)
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "asgi:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning", "--backlog", "4096"],
+        cwd=ROOT_DIR, env=os.environ.copy()
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {proc.returncode}")
+        try:
+            httpx.get(f"{base_url}/login", timeout=1)
+            return proc, base_url
+        except httpx.TransportError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("uvicorn did not start in time")
+
+
+def run_phase(make_client, route, ctx, requests_count, concurrency, trace_memory=False, server_pid="self"):
+    scenario = SCENARIOS[route]
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def logged_in(_):
+        c = make_client()
+        c.post("/login", data={"username": ctx["user"], "password": BENCH_PASSWORD})
+        return c
+
+    # log every client in before the clock starts; password hashing is not what we measure
+    clients = queue.SimpleQueue()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for c in pool.map(logged_in, range(min(concurrency, requests_count))):
+            clients.put(c)
+
+    def one(i):
+        c = clients.get()
+        start = time.perf_counter()
+        try:
+            resp = scenario(c, i, ctx)
+            resp.get_data()
+            failed = resp.status_code >= 400
+        except Exception:
+            failed = True
+        elapsed = time.perf_counter() - start
+        clients.put(c)
+        with lock:
+            latencies.append(elapsed)
+            if failed:
+                errors[0] += 1
+
+    if trace_memory:
+        tracemalloc.start()
+    rss_before = _rss_mb(server_pid)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(requests_count)))
+    wall = time.perf_counter() - started
+
+    result = {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+        "p50_ms": round(_percentile(sorted(latencies), 50) * 1000, 3),
+        "p99_ms": round(_percentile(sorted(latencies), 99) * 1000, 3),
+        "rss_delta_mb": round(_rss_mb(server_pid) - rss_before, 2),
+    }
+    if trace_memory:
+        result["tracemalloc_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+        tracemalloc.stop()
+    return result
+
+
+def compare(report, baseline, max_regression):
+    """Return a list of human-readable regressions against a previous report."""
+    problems = []
+    for route, current in report["routes"].items():
+        previous = baseline.get("routes", {}).get(route)
+        if not previous:
+            continue
+        if previous["p99_ms"] and current["p99_ms"] > previous["p99_ms"] * (1 + max_regression):
+            problems.append(f"{route}: p99 {previous['p99_ms']}ms -> {current['p99_ms']}ms")
+        if previous["throughput_rps"] and current["throughput_rps"] < previous["throughput_rps"] * (1 - max_regression):
+            problems.append(f"{route}: throughput {previous['throughput_rps']} -> {current['throughput_rps']} rps")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ProjAI routes against synthetic data.")
+    parser.add_argument("--records", type=int, default=1000, help="entries per data file (1k to 1M)")
+    parser.add_argument("--requests", type=int, default=200, help="requests per route")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--routes", default=",".join(DEFAULT_ROUTES), help="comma separated subset of routes")
+    parser.add_argument("--llm-delay", type=float, default=0.05, help="stub LLM response delay in seconds")
+    parser.add_argument("--upload-bytes", type=int, default=64 * 1024)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tracemalloc", action="store_true", help="record Python heap peak per route (slower)")
+    parser.add_argument("--out", help="write the JSON report here as well as stdout")
+    parser.add_argument("--baseline", help="previous JSON report to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    parser.add_argument("--keep-data", action="store_true", help="do not delete the generated data folder")
+    parser.add_argument("--asgi", action="store_true", help="serve asgi:app with uvicorn and send requests over HTTP")
+    args = parser.parse_args()
+
+    routes = [r.strip() for r in args.routes.split(",") if r.strip()]
+    unknown = [r for r in routes if r not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown routes: {', '.join(unknown)}")
+    if args.asgi and args.tracemalloc:
+        parser.error("--tracemalloc only applies to the in-process Flask mode")
+
+    work_dir = tempfile.mkdtemp(prefix="projai-bench-")
+    data_dir = os.path.join(work_dir, "data")
+    upload_dir = os.path.join(work_dir, "uploads")
+    try:
+        gen_start = time.perf_counter()
+        skills = generate(data_dir, args.records, args.seed)
+        gen_seconds = time.perf_counter() - gen_start
+
+        stub, llm_url = start_stub(args.llm_delay)
+        server = None
+        import_start = time.perf_counter()
+        if args.asgi:
+            server, base_url = start_asgi_server(data_dir, upload_dir, llm_url)
+            make_client, server_pid = (lambda: HttpClient(base_url)), server.pid
+        else:
+            make_client, server_pid = _load_app(data_dir, upload_dir, llm_url).test_client, "self"
+        import_seconds = time.perf_counter() - import_start
+
+        ctx = {
+            "rng": random.Random(args.seed),
+            "user": _username(0),
+            "skills": skills,
+            "records": args.records,
+            "upload_bytes": args.upload_bytes,
+        }
+        report = {
+            "config": {
+                "records": args.records,
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "llm_delay": args.llm_delay,
+                "mode": "asgi" if args.asgi else "flask",
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "setup": {
+                "datagen_seconds": round(gen_seconds, 3),
+                # import + create_app(), or uvicorn start-up until it answers (--asgi)
+                "app_import_seconds": round(import_seconds, 3),
+            },
+            "routes": {},
+        }
+        try:
+            for route in routes:
+                result = run_phase(make_client, route, ctx, args.requests, args.concurrency,
+                                   args.tracemalloc, server_pid)
+                if route == "mixed":
+                    result["lost_ideas"] = _lost_ideas(data_dir, args.records)
+                    result["errors"] += result["lost_ideas"]
+                report["routes"][route] = result
+            if server:
+                report["memory"] = {"server_rss_mb": round(_rss_mb(server_pid), 2)}
+            else:
+                report["memory"] = {"max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 2)}
+        finally:
+            if server:
+                server.terminate()
+                server.wait()
+            stub.shutdown()
+    finally:
+        if args.keep_data:
+            print(f"data kept in {work_dir}", file=sys.stderr)
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            problems = compare(report, json.load(f), args.max_regression)
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
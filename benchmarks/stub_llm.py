@@ -0,0 +1,41 @@
+"""Local stand-in for the Gemini generateContent API.
+
+Answers every POST with a Gemini-shaped response after a fixed delay, so
+/recommend can be benchmarked without network access or an API key.
+"""
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_TEXT = "1) Define scope.\n2) Choose tech stack.\n3) Build MVP.\n4) Ship and iterate."
+
+
+def start_stub(delay=0.05, host="127.0.0.1", port=0):
+    """Start the stub in a background thread. Returns (server, url)."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            self.rfile.read(length)
+            time.sleep(delay)
+            body = json.dumps({
+                "candidates": [{"content": {"parts": [{"text": STUB_TEXT}]}}]
+            }).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        # default backlog of 5 refuses connections under high concurrency
+        request_queue_size = 1024
+
+    server = Server((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_port}/v1beta/models/stub:generateContent"
@@ -1,12 +1,17 @@
 import json
 import os
 
-FEED_FILE = "data/feed.json"
+from modules import metrics
 
-# Ensure data folder exists
-if not os.path.exists("data"):
-    os.makedirs("data")
+# same data folder as app.py (PROJAI_DATA_DIR), independent of the working directory
+DATA_FOLDER = os.getenv("PROJAI_DATA_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data"))
+FEED_FILE = os.path.join(DATA_FOLDER, "feed.json")
 
+# Ensure data folder exists (on write, not at import)
+def _ensure_data_folder():
+    os.makedirs(os.path.dirname(FEED_FILE), exist_ok=True)
+
+@metrics.timed_io(FEED_FILE, "r")
 def load_feed():
     try:
         with open(FEED_FILE, "r") as f:
@@ -14,17 +19,15 @@ def load_feed():
     except FileNotFoundError:
         return {}
 
+@metrics.timed_io(FEED_FILE, "w")
 def save_feed(feed):
+    _ensure_data_folder()
     with open(FEED_FILE, "w") as f:
         json.dump(feed, f, indent=4)
 
 def collaborate(user_name, idea, sector, language):
     # Load existing feed
-    if os.path.exists(FEED_FILE):
-        with open(FEED_FILE, "r") as f:
-            feed = json.load(f)
-    else:
-        feed = {}
+    feed = load_feed()
 
     # User ideas array
     if user_name not in feed:
@@ -39,14 +42,9 @@ def collaborate(user_name, idea, sector, language):
     })
 
     # Save back
-    with open(FEED_FILE, "w") as f:
-        json.dump(feed, f, indent=4)
+    save_feed(feed)
 
 
 # 2️⃣ Show feed function: ideas display cheyyali
 def show_feed():
-    if os.path.exists(FEED_FILE):
-        with open(FEED_FILE, "r") as f:
-            feed = json.load(f)
-        return feed
-    return {}
+    return load_feed()
@@ -0,0 +1,268 @@
+import os
+import json
+import time
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import g, request, before_render_template, template_rendered
+
+# -------------------------
+# Settings (env overridable)
+# -------------------------
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "500"))
+SLOW_REQUEST_LOG = os.getenv("SLOW_REQUEST_LOG", "")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# name -> (type, help, buckets)
+METRICS = {
+    "projai_request_duration_seconds": ("histogram", "Request latency per route.", LATENCY_BUCKETS),
+    "projai_response_size_bytes": ("histogram", "Response body size per route.", SIZE_BUCKETS),
+    "projai_request_size_bytes": ("histogram", "Request body size per route.", SIZE_BUCKETS),
+    "projai_stage_duration_seconds": ("histogram", "Self time of internal stages (file I/O, AI calls, DOCX, templates), excluding nested stages.", LATENCY_BUCKETS),
+    "projai_outbound_request_duration_seconds": ("histogram", "Latency of outbound API calls.", LATENCY_BUCKETS),
+    "projai_data_bytes_read_total": ("counter", "Bytes read per data file.", None),
+    "projai_data_bytes_written_total": ("counter", "Bytes written per data file.", None),
+    "projai_requests_total": ("counter", "Requests served per route and status.", None),
+}
+
+_lock = threading.Lock()
+_series = {}  # (name, labels tuple) -> [bucket counts..., sum, count] or float
+
+slow_log = logging.getLogger("projai.slow_requests")
+
+# per-request stage/IO accounting; a ContextVar rather than flask.g so the
+# ASGI handlers (and the worker threads they hand off to) are covered too
+_request_state = contextvars.ContextVar("projai_request_state", default=None)
+
+
+def _observe(name, labels, value):
+    buckets = METRICS[name][2]
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        series = _series.get(key)
+        if series is None:
+            series = _series[key] = [0] * len(buckets) + [0.0, 0]
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                series[i] += 1
+        series[-2] += value
+        series[-1] += 1
+
+
+def _inc(name, labels, amount=1):
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _series[key] = _series.get(key, 0) + amount
+
+
+def _record_stage(name, elapsed):
+    _observe("projai_stage_duration_seconds", {"stage": name}, elapsed)
+    state = _request_state.get()
+    if state is not None:
+        stages = state["stages"]
+        stages[name] = stages.get(name, 0.0) + elapsed
+
+
+# Stages nest (import:docx inside build_docx, a partial inside its page), so
+# each records its self time: its duration minus that of the stages inside
+# it. The per-request breakdown then adds up to at most the request time.
+def _begin_stage():
+    frame = [time.perf_counter(), 0.0]  # start, time spent in nested stages
+    state = _request_state.get()
+    if state is not None:
+        state["stack"].append(frame)
+    return frame
+
+
+def _end_stage(name, frame):
+    elapsed = time.perf_counter() - frame[0]
+    state = _request_state.get()
+    if state is not None:
+        stack = state["stack"]
+        # also drops frames left open by a template render that raised
+        while stack and stack.pop() is not frame:
+            pass
+        if stack:
+            stack[-1][1] += elapsed
+    _record_stage(name, elapsed - frame[1])
+    return elapsed
+
+
+# -------------------------
+# Instrumentation hooks
+# -------------------------
+@contextmanager
+def stage(name):
+    """Time a block of work and attribute it to the current request."""
+    frame = _begin_stage()
+    try:
+        yield
+    finally:
+        _end_stage(name, frame)
+
+
+@contextmanager
+def outbound(target):
+    """Time an outbound API call (also recorded as a stage)."""
+    frame = _begin_stage()
+    try:
+        yield
+    finally:
+        elapsed = _end_stage(f"outbound:{target}", frame)
+        _observe("projai_outbound_request_duration_seconds", {"target": target}, elapsed)
+
+
+def track_io(path, mode, nbytes=None):
+    """Count bytes read ("r") or written ("w") for a data file; defaults to file size."""
+    if nbytes is None:
+        try:
+            nbytes = os.path.getsize(path)
+        except OSError:
+            return
+    name = "projai_data_bytes_read_total" if mode == "r" else "projai_data_bytes_written_total"
+    _inc(name, {"file": os.path.basename(path)}, nbytes)
+    state = _request_state.get()
+    if state is not None:
+        state["io"][mode] += nbytes
+
+
+def _record_request(route, status, elapsed, request_bytes=None, response_bytes=None):
+    _observe("projai_request_duration_seconds", {"route": route}, elapsed)
+    _inc("projai_requests_total", {"route": route, "status": status})
+    if request_bytes:
+        _observe("projai_request_size_bytes", {"route": route}, request_bytes)
+    if response_bytes is not None:
+        _observe("projai_response_size_bytes", {"route": route}, response_bytes)
+
+
+def begin_request():
+    """Start timing a request; pass the returned token to finish_request()."""
+    return _request_state.set({
+        "start": time.perf_counter(),
+        "stages": {},
+        "io": {"r": 0, "w": 0},
+        "stack": [],
+        "render_frames": [],
+    })
+
+
+def finish_request(token, method, path, route, status, request_bytes=None, response_bytes=None):
+    """Record a served request and write the slow-request log entry (Flask and ASGI)."""
+    state = _request_state.get()
+    _request_state.reset(token)
+    elapsed = time.perf_counter() - state["start"]
+
+    _record_request(route, status, elapsed, request_bytes, response_bytes)
+
+    if elapsed * 1000 >= SLOW_REQUEST_MS:
+        slow_log.warning(json.dumps({
+            "method": method,
+            "path": path,
+            "route": route,
+            "status": status,
+            "duration_ms": round(elapsed * 1000, 2),
+            "stages_ms": {k: round(v * 1000, 2) for k, v in state["stages"].items()},
+            "bytes_read": state["io"]["r"],
+            "bytes_written": state["io"]["w"],
+        }))
+
+
+def timed_io(path, mode):
+    """Decorator for load_*/save_* helpers: time the call and count file bytes."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(func.__name__):
+                result = func(*args, **kwargs)
+            track_io(path, mode)
+            return result
+        return wrapper
+    return decorator
+
+
+# -------------------------
+# Prometheus exposition
+# -------------------------
+def _fmt_labels(labels, extra=None):
+    items = list(labels) + (extra or [])
+    if not items:
+        return ""
+    body = ",".join('{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"')) for k, v in items)
+    return "{" + body + "}"
+
+
+def render_prometheus():
+    with _lock:
+        snapshot = {k: (list(v) if isinstance(v, list) else v) for k, v in _series.items()}
+
+    lines = []
+    for name, (kind, help_text, buckets) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for (series_name, labels), value in sorted(snapshot.items()):
+            if series_name != name:
+                continue
+            if kind == "counter":
+                lines.append(f"{name}{_fmt_labels(labels)} {value}")
+                continue
+            for bound, count in zip(buckets, value):
+                lines.append(f"{name}_bucket{_fmt_labels(labels, [('le', bound)])} {count}")
+            lines.append(f"{name}_bucket{_fmt_labels(labels, [('le', '+Inf')])} {value[-1]}")
+            lines.append(f"{name}_sum{_fmt_labels(labels)} {value[-2]}")
+            lines.append(f"{name}_count{_fmt_labels(labels)} {value[-1]}")
+    return "\n".join(lines) + "\n"
+
+
+# -------------------------
+# Flask wiring
+# -------------------------
+def _route_label():
+    return request.endpoint or "<unmatched>"
+
+
+def _before_request():
+    g._metrics_token = begin_request()
+
+
+def _after_request(response):
+    token = g.pop("_metrics_token", None)
+    if token is None:
+        return response
+    finish_request(token, request.method, request.path, _route_label(), response.status_code,
+                   request.content_length, response.content_length)
+    return response
+
+
+def _on_before_render(sender, template, context, **extra):
+    # a stack, since partials can be rendered from inside another template
+    state = _request_state.get()
+    if state is not None:
+        state["render_frames"].append(_begin_stage())
+
+
+def _on_rendered(sender, template, context, **extra):
+    state = _request_state.get()
+    if state is not None and state["render_frames"]:
+        _end_stage(f"render:{template.name}", state["render_frames"].pop())
+
+
+def init_app(app):
+    """Register request timing hooks, template timing and the /metrics endpoint."""
+    if SLOW_REQUEST_LOG and not slow_log.handlers:
+        handler = logging.FileHandler(SLOW_REQUEST_LOG, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        slow_log.addHandler(handler)
+
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    before_render_template.connect(_on_before_render, app)
+    template_rendered.connect(_on_rendered, app)
+
+    @app.route("/metrics")
+    def metrics():
+        return app.response_class(render_prometheus(), mimetype="text/plain; version=0.0.4")
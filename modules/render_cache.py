@@ -0,0 +1,158 @@
+import os
+import gzip
+import hashlib
+import threading
+
+from flask import request
+
+# optional brotli support; gzip is always available
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "500"))
+COMPRESS_MIMETYPES = {
+    "text/html", "text/css", "text/plain", "text/javascript",
+    "application/javascript", "application/json"
+}
+STATIC_MAX_AGE = 365 * 24 * 60 * 60
+
+# -------------------------
+# Fragment cache: rendered HTML keyed by (name, version)
+# -------------------------
+_fragments = {}
+_fragments_lock = threading.Lock()
+
+
+def fragment(name, version, render):
+    """Return the cached fragment for this version, rendering it on a miss."""
+    key = (name, version)
+    cached = _fragments.get(key)
+    if cached is not None:
+        return cached
+    html = render()
+    with _fragments_lock:
+        # drop fragments rendered for older versions of the same name
+        for old in [k for k in _fragments if k[0] == name and k[1] != version]:
+            del _fragments[old]
+        _fragments[key] = html
+    return html
+
+
+# -------------------------
+# Static asset fingerprints (content hash, recomputed when the file changes)
+# -------------------------
+_asset_hashes = {}
+
+
+def asset_hash(static_folder, filename):
+    path = os.path.join(static_folder, filename)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = _asset_hashes.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, "rb") as f:
+        digest = hashlib.md5(f.read()).hexdigest()[:12]
+    _asset_hashes[path] = (mtime, digest)
+    return digest
+
+
+# -------------------------
+# Response compression
+# -------------------------
+def _pick_encoding(accept_encoding):
+    accepted = {part.split(";")[0].strip() for part in accept_encoding.lower().split(",")}
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _encode(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+_static_compressed = {}
+
+
+def compress_static(response, path, digest):
+    """Serve a static file from an in-memory compressed copy (one per content hash)."""
+    if response.mimetype not in COMPRESS_MIMETYPES or "Content-Encoding" in response.headers:
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = _pick_encoding(request.headers.get("Accept-Encoding", ""))
+    if encoding is None or os.path.getsize(path) < COMPRESS_MIN_SIZE:
+        return response
+    key = (path, digest, encoding)
+    body = _static_compressed.get(key)
+    if body is None:
+        with open(path, "rb") as f:
+            body = _static_compressed[key] = _encode(f.read(), encoding)
+    if hasattr(response.response, "close"):
+        response.response.close()
+    response.direct_passthrough = False
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag:
+        # send_file checked If-None-Match against the unencoded ETag; check again
+        response.set_etag(f"{etag}-{encoding}", weak)
+        response.make_conditional(request)
+    return response
+
+
+def compress_response(response):
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code in (204, 304)
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESS_MIMETYPES):
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = _pick_encoding(request.headers.get("Accept-Encoding", ""))
+    if encoding is None:
+        return response
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+    response.set_data(_encode(body, encoding))
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+# -------------------------
+# Flask wiring
+# -------------------------
+def init_app(app):
+    """Fingerprint static URLs, cache fingerprinted assets long-term, compress responses."""
+
+    @app.url_defaults
+    def _fingerprint_static(endpoint, values):
+        if endpoint == "static" and "filename" in values and "v" not in values:
+            digest = asset_hash(app.static_folder, values["filename"])
+            if digest:
+                values["v"] = digest
+
+    @app.after_request
+    def _cache_and_compress(response):
+        if request.endpoint == "static":
+            if response.status_code != 200:
+                return response
+            filename = request.view_args.get("filename", "")
+            digest = asset_hash(app.static_folder, filename)
+            if not digest:
+                return response
+            if request.args.get("v") == digest:
+                response.cache_control.no_cache = None
+                response.cache_control.public = True
+                response.cache_control.max_age = STATIC_MAX_AGE
+                response.cache_control.immutable = True
+                response.expires = None
+            return compress_static(response, os.path.join(app.static_folder, filename), digest)
+        return compress_response(response)